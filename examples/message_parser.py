@@ -82,9 +82,7 @@ class Decoder:
             try:
                 decoder.addToFrame(message)
                 if decoder.checkFrame():
-                    slave = decoder._header.get(  # pylint: disable=protected-access
-                        "uid", 0x00
-                    )
+                    slave = decoder._header.uid  # pylint: disable=protected-access
                     decoder.advanceFrame()
                     decoder.processIncomingPacket(message, self.report, slave)
                 else:
@@ -131,6 +131,8 @@ class ModbusBaseClient(ModbusClientMixin, ModbusProtocol):
 
         Applications can call message functions without checking idle_time(),
         this is done automatically.
+
+        The value is on the time.monotonic() clock, like last_frame_end.
         """
         if self.last_frame_end is None or self.silent_interval is None:
             return 0
@@ -392,6 +394,8 @@ class ModbusBaseSyncClient(ModbusClientMixin, ModbusProtocol):
 
         Applications can call message functions without checking idle_time(),
         this is done automatically.
+
+        The value is on the time.monotonic() clock, like last_frame_end.
         """
         if self.last_frame_end is None or self.silent_interval is None:
             return 0
@@ -169,6 +169,7 @@ class ServerDecoder:
         """Initialize the client lookup tables."""
         functions = {f.function_code for f in self.__function_table}
         self.lookup = self.getFCdict()
+        self.lookup_version = 0  # incremented by register()
         self.__sub_lookup = {f: {} for f in functions}
         for f in self.__sub_function_table:
             self.__sub_lookup[f.function_code][f.sub_function_code] = f
@@ -235,6 +236,7 @@ class ServerDecoder:
                 "`pymodbus.pdu.ModbusRequest` "
             )
         self.lookup[function.function_code] = function
+        self.lookup_version += 1
         if hasattr(function, "sub_function_code"):
             if function.function_code not in self.__sub_lookup:
                 self.__sub_lookup[function.function_code] = {}
@@ -298,6 +300,7 @@ class ClientDecoder:
         """Initialize the client lookup tables."""
         functions = {f.function_code for f in self.function_table}
         self.lookup = {f.function_code: f for f in self.function_table}
+        self.lookup_version = 0  # incremented by register()
         self.__sub_lookup = {f: {} for f in functions}
         for f in self.__sub_function_table:
             self.__sub_lookup[f.function_code][f.sub_function_code] = f
@@ -366,6 +369,7 @@ class ClientDecoder:
                 "`pymodbus.pdu.ModbusResponse` "
             )
         self.lookup[function.function_code] = function
+        self.lookup_version += 1
         if hasattr(function, "sub_function_code"):
             if function.function_code not in self.__sub_lookup:
                 self.__sub_lookup[function.function_code] = {}
@@ -65,15 +65,15 @@ class ModbusAsciiFramer(ModbusFramer):
         if start == -1:
             return False
         if start > 0:  # go ahead and skip old bad data
-            self._buffer = self._buffer[start:]
+            del self._buffer[:start]
             start = 0
 
         if (end := self._buffer.find(self._end)) != -1:
-            self._header["len"] = end
-            self._header["uid"] = int(self._buffer[1:3], 16)
-            self._header["lrc"] = int(self._buffer[end - 2 : end], 16)
+            self._header.len = end
+            self._header.uid = int(self._buffer[1:3], 16)
+            self._header.lrc = int(self._buffer[end - 2 : end], 16)
             data = a2b_hex(self._buffer[start + 1 : end - 2])
-            return checkLRC(data, self._header["lrc"])
+            return checkLRC(data, self._header.lrc)
         return False
 
     def advanceFrame(self):
@@ -83,8 +83,8 @@ class ModbusAsciiFramer(ModbusFramer):
         it or determined that it contains an error. It also has to reset the
         current frame header handle
         """
-        self._buffer = self._buffer[self._header["len"] + 2 :]
-        self._header = {"lrc": "0000", "len": 0, "uid": 0x00}
+        del self._buffer[: self._header.len + 2]
+        self._header.reset()
 
     def isFrameReady(self):
         """Check if we should continue decode logic.
@@ -102,7 +102,7 @@ class ModbusAsciiFramer(ModbusFramer):
         :returns: The frame data or ""
         """
         start = self._hsize + 1
-        end = self._header["len"] - 2
+        end = self._header.len - 2
         buffer = self._buffer[start:end]
         if end > 0:
             return a2b_hex(buffer)
@@ -117,7 +117,7 @@ class ModbusAsciiFramer(ModbusFramer):
             if not self.checkFrame():
                 break
             if not self._validate_slave_id(slave, single):
-                header_txt = self._header["uid"]
+                header_txt = self._header.uid
                 Log.error("Not a valid slave id - {}, ignoring!!", header_txt)
                 self.resetFrame()
                 continue
@@ -19,6 +19,28 @@ SOCKET_FRAME_HEADER = BYTE_ORDER + "HHH" + FRAME_HEADER
 TLS_FRAME_HEADER = BYTE_ORDER + "B"
 
 
+class _Header:  # pylint: disable=too-few-public-methods
+    """Header of the frame being decoded.
+
+    A slotted object, the fields are accessed for every frame.
+    """
+
+    __slots__ = ("crc", "len", "lrc", "pid", "tid", "uid")
+
+    def __init__(self) -> None:
+        """Initialize a new header."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all fields to their defaults."""
+        self.lrc: Any = "0000"
+        self.len: int = 0
+        self.uid: int = 0x00
+        self.tid: int = 0
+        self.pid: int = 0
+        self.crc: int = 0x0000
+
+
 class ModbusFramer:
     """Base Framer class."""
 
@@ -35,15 +57,8 @@ class ModbusFramer:
         """
         self.decoder = decoder
         self.client = kwargs.get('client')
-        self._header: dict[str, Any] = {
-            "lrc": "0000",
-            "len": 0,
-            "uid": 0x00,
-            "tid": 0,
-            "pid": 0,
-            "crc": b"\x00\x00",
-        }
-        self._buffer = b""
+        self._header = _Header()
+        self._buffer = bytearray()
 
     def _validate_slave_id(self, slaves: list, single: bool) -> bool:
         """Validate if the received data is valid for the client.
@@ -58,7 +73,7 @@ class ModbusFramer:
             # Handle Modbus TCP slave identifier (0x00 0r 0xFF)
             # in asynchronous requests
             return True
-        return self._header["uid"] in slaves
+        return self._header.uid in slaves
 
     def sendPacket(self, message):
         """Send packets on the bus.
@@ -90,15 +105,8 @@ class ModbusFramer:
         Log.debug(
             "Resetting frame - Current Frame in buffer - {}", self._buffer, ":hex"
         )
-        self._buffer = b""
-        self._header = {
-            "lrc": "0000",
-            "crc": b"\x00\x00",
-            "len": 0,
-            "uid": 0x00,
-            "pid": 0,
-            "tid": 0,
-        }
+        self._buffer = bytearray()
+        self._header.reset()
 
     def populateResult(self, result):
         """Populate the modbus result header.
@@ -108,9 +116,9 @@ class ModbusFramer:
 
         :param result: The response packet
         """
-        result.slave_id = self._header.get("uid", 0)
-        result.transaction_id = self._header.get("tid", 0)
-        result.protocol_id = self._header.get("pid", 0)
+        result.slave_id = self._header.uid
+        result.transaction_id = self._header.tid
+        result.protocol_id = self._header.pid
 
     def processIncomingPacket(self, data, callback, slave, **kwargs):
         """Process new packet pattern.
@@ -76,14 +76,15 @@ class ModbusBinaryFramer(ModbusFramer):
         if start == -1:
             return False
         if start > 0:  # go ahead and skip old bad data
-            self._buffer = self._buffer[start:]
+            del self._buffer[:start]
+            start = 0
 
         if (end := self._buffer.find(self._end)) != -1:
-            self._header["len"] = end
-            self._header["uid"] = struct.unpack(">B", self._buffer[1:2])[0]
-            self._header["crc"] = struct.unpack(">H", self._buffer[end - 2 : end])[0]
+            self._header.len = end
+            self._header.uid = struct.unpack(">B", self._buffer[1:2])[0]
+            self._header.crc = struct.unpack(">H", self._buffer[end - 2 : end])[0]
             data = self._buffer[start + 1 : end - 2]
-            return checkCRC(data, self._header["crc"])
+            return checkCRC(data, self._header.crc)
         return False
 
     def advanceFrame(self) -> None:
@@ -93,8 +94,8 @@ class ModbusBinaryFramer(ModbusFramer):
         it or determined that it contains an error. It also has to reset the
         current frame header handle
         """
-        self._buffer = self._buffer[self._header["len"] + 2 :]
-        self._header = {"crc": 0x0000, "len": 0, "uid": 0x00}
+        del self._buffer[: self._header.len + 2]
+        self._header.reset()
 
     def isFrameReady(self) -> bool:
         """Check if we should continue decode logic.
@@ -112,10 +113,8 @@ class ModbusBinaryFramer(ModbusFramer):
         :returns: The frame data or ""
         """
         start = self._hsize + 1
-        end = self._header["len"] - 2
-        buffer = self._buffer[start:end]
-        if end > 0:
-            return buffer
+        if (end := self._header.len - 2) > 0:
+            return bytes(self._buffer[start:end])
         return b""
 
     # ----------------------------------------------------------------------- #
@@ -129,7 +128,7 @@ class ModbusBinaryFramer(ModbusFramer):
                 self.resetFrame()
                 break
             if not self._validate_slave_id(slave, single):
-                header_txt = self._header["uid"]
+                header_txt = self._header.uid
                 Log.debug("Not a valid slave id - {}, ignoring!!", header_txt)
                 self.resetFrame()
                 break
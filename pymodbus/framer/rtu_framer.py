@@ -14,6 +14,9 @@ from pymodbus.utilities import ModbusTransactionState, checkCRC, computeCRC
 
 RTU_FRAME_HEADER = BYTE_ORDER + FRAME_HEADER
 
+_RTU_HDR = struct.Struct(RTU_FRAME_HEADER)
+_U16_BE = struct.Struct(">H")
+
 
 # --------------------------------------------------------------------------- #
 # Modbus RTU Message
@@ -62,7 +65,48 @@ class ModbusRtuFramer(ModbusFramer):
         self._hsize = 0x01
         self._end = b"\x0d\x0a"
         self._min_frame_size = 4
+        self._slave_key = None
+        self._slave_table = bytes(256)
+
+    @property
+    def decoder(self):
+        """Return the decoder."""
+        return self._decoder
+
+    @decoder.setter
+    def decoder(self, decoder):
+        """Set the decoder, the lookups cached from it are rebuilt on first use."""
+        self._decoder = decoder
         self.function_codes = decoder.lookup.keys() if decoder else {}
+        self._fc_table = bytes(256)
+        self._rtu_size_fn = None
+        self._lookup_version = None
+
+    def _build_fc_table(self):
+        """Return a table marking the known function and exception codes with 1."""
+        fc_table = bytearray(256)
+        for fcode in self.function_codes:
+            fc_table[fcode] = fc_table[fcode | 0x80] = 1  # exception responses
+        return bytes(fc_table)
+
+    def _lookups_current(self):
+        """Rebuild the lookups cached from the decoder, if its lookup changed.
+
+        The decoder increments lookup_version in register().
+
+        :returns: False if the decoder has no lookup_version, the cache is not usable
+        """
+        if (version := getattr(self._decoder, "lookup_version", None)) is None:
+            return False
+        if version != self._lookup_version:
+            lookup_pdu_class = self._decoder.lookupPduClass
+            self._fc_table = self._build_fc_table()
+            # frame size per function code, as resolved by the decoder
+            self._rtu_size_fn = [
+                lookup_pdu_class(fcode).calculateRtuFrameSize for fcode in range(256)
+            ]
+            self._lookup_version = version
+        return True
 
     # ----------------------------------------------------------------------- #
     # Private Helper Functions
@@ -84,15 +128,24 @@ class ModbusRtuFramer(ModbusFramer):
         2. Discard frame if UID does not match
         """
         try:
-            self.populateHeader()
-            frame_size = self._header["len"]
-            data = self._buffer[: frame_size - 2]
-            crc = self._header["crc"]
-            crc_val = (int(crc[0]) << 8) + int(crc[1])
-            return checkCRC(data, crc_val)
-        except (IndexError, KeyError, struct.error):
+            _ready, valid = self._try_parse_frame()
+            return valid
+        except (KeyError, struct.error):
             return False
 
+    def _try_parse_frame(self):
+        """Check readiness and CRC of the next frame in one pass.
+
+        Combines isFrameReady() and checkFrame(), the header is only populated once.
+
+        :returns: (ready, valid) ready is False if the frame is not yet complete
+        """
+        try:
+            size = self.populateHeader()
+        except IndexError:
+            return False, False
+        return True, checkCRC(memoryview(self._buffer)[: size - 2], self._header.crc)
+
     def advanceFrame(self):
         """Skip over the current framed message.
 
@@ -100,9 +153,9 @@ class ModbusRtuFramer(ModbusFramer):
         it or determined that it contains an error. It also has to reset the
         current frame header handle
         """
-        self._buffer = self._buffer[self._header["len"] :]
+        del self._buffer[: self._header.len]
         Log.debug("Frame advanced, resetting header!!")
-        self._header = {"uid": 0x00, "len": 0, "crc": b"\x00\x00"}
+        self._header.reset()
 
     def resetFrame(self):
         """Reset the entire message frame.
@@ -125,7 +178,7 @@ class ModbusRtuFramer(ModbusFramer):
 
         :returns: True if ready, False otherwise
         """
-        size = self._header.get("len", 0)
+        size = self._header.len
         if not size and len(self._buffer) > self._hsize:
             try:
                 # Frame is ready only if populateHeader() successfully
@@ -147,15 +200,15 @@ class ModbusRtuFramer(ModbusFramer):
         `self._buffer` is not yet long enough.
         """
         data = data if data is not None else self._buffer
-        self._header["uid"] = int(data[0])
-        self._header["tid"] = int(data[0])
+        header = self._header
+        header.uid = header.tid = int(data[0])
         size = self.get_expected_response_length(data)
-        self._header["len"] = size
+        header.len = size
 
         if len(data) < size:
             # crc yet not available
             raise IndexError
-        self._header["crc"] = data[size - 2 : size]
+        header.crc = int.from_bytes(data[size - 2 : size], "big")
         return size
 
     def getFrame(self):
@@ -164,8 +217,8 @@ class ModbusRtuFramer(ModbusFramer):
         :returns: The frame data or ""
         """
         start = self._hsize
-        end = self._header["len"] - 2
-        buffer = self._buffer[start:end]
+        end = self._header.len - 2
+        buffer = bytes(self._buffer[start:end])
         if end > 0:
             Log.debug("Getting Frame - {}", buffer, ":hex")
             return buffer
@@ -179,27 +232,61 @@ class ModbusRtuFramer(ModbusFramer):
 
         :param result: The response packet
         """
-        result.slave_id = self._header["uid"]
-        result.transaction_id = self._header["tid"]
+        result.slave_id = self._header.uid
+        result.transaction_id = self._header.tid
+
+    def _get_slave_table(self, slaves):
+        """Return a translate table mapping valid slave ids to 1, other bytes to 0."""
+        if (key := tuple(slaves)) != self._slave_key:
+            table = bytearray(256)
+            for slave in slaves:
+                if 0 <= slave <= 0xFF:
+                    table[slave] = 1
+            self._slave_key = key
+            self._slave_table = bytes(table)
+        return self._slave_table
+
+    @staticmethod
+    def _find_marks(marks, start, end, mark=1):
+        """Yield the positions of all mark bytes in marks[start:end]."""
+        while (i := marks.find(mark, start, end)) != -1:
+            yield i
+            start = i + 1
 
     def getFrameStart(self, slaves, broadcast, skip_cur_frame):
         """Scan buffer for a relevant frame start."""
         start = 1 if skip_cur_frame else 0
         if (buf_len := len(self._buffer)) < 4:
             return False
-        for i in range(start, buf_len - 3):  # <slave id><function code><crc 2 bytes>
-            if not broadcast and self._buffer[i] not in slaves:
-                continue
-            if (
-                self._buffer[i + 1] not in self.function_codes
-                and (self._buffer[i + 1] - 0x80) not in self.function_codes
-            ):
+        buf = self._buffer
+        end = buf_len - 3  # <slave id><function code><crc 2 bytes>
+        # normally the frame starts right here, check it before scanning the buffer
+        if start < end and (broadcast or buf[start] in slaves):
+            fcode = buf[start + 1]
+            if fcode in self.function_codes or fcode - 0x80 in self.function_codes:
+                if start:
+                    del buf[:start]
+                return True
+        fc_table = self._fc_table if self._lookups_current() else self._build_fc_table()
+        if broadcast:
+            # any slave id, so only look for a known function code in the next byte
+            marks = buf[start + 1 : end + 1].translate(fc_table)
+            candidates = (start + i for i in self._find_marks(marks, 0, len(marks)))
+        elif len(slaves) == 1 and 0 <= slaves[0] <= 0xFF:
+            # single slave id, search it directly without a translated copy
+            candidates = self._find_marks(buf, start, end, slaves[0])
+        else:
+            # translate/find locate the valid slave ids without a python loop
+            marks = buf[start:end].translate(self._get_slave_table(slaves))
+            candidates = (start + i for i in self._find_marks(marks, 0, len(marks)))
+        for i in candidates:
+            if not fc_table[buf[i + 1]]:
                 continue
             if i:
-                self._buffer = self._buffer[i:]  # remove preceding trash.
+                del buf[:i]  # remove preceding trash.
             return True
         if buf_len > 3:
-            self._buffer = self._buffer[-3:]
+            del buf[:-3]
         return False
 
     # ----------------------------------------------------------------------- #
@@ -209,22 +296,29 @@ class ModbusRtuFramer(ModbusFramer):
         """Process new packet pattern."""
         broadcast = not slave[0]
         skip_cur_frame = False
-        while self.getFrameStart(slave, broadcast, skip_cur_frame):
-            if not self.isFrameReady():
+        # bind the per frame methods once, all queued frames are handled in this loop
+        get_frame_start = self.getFrameStart
+        try_parse_frame = self._try_parse_frame
+        validate_slave_id = self._validate_slave_id
+        reset_frame = self.resetFrame
+        process = self._process
+        while get_frame_start(slave, broadcast, skip_cur_frame):
+            ready, valid = try_parse_frame()
+            if not ready:
                 Log.debug("Frame - not ready")
                 break
-            if not self.checkFrame():
+            if not valid:
                 Log.debug("Frame check failed, ignoring!!")
-                self.resetFrame()
+                reset_frame()
                 skip_cur_frame = True
                 continue
-            if not self._validate_slave_id(slave, single):
-                header_txt = self._header["uid"]
+            if not validate_slave_id(slave, single):
+                header_txt = self._header.uid
                 Log.debug("Not a valid slave id - {}, ignoring!!", header_txt)
-                self.resetFrame()
+                reset_frame()
                 skip_cur_frame = True
                 continue
-            self._process(callback)
+            process(callback)
 
     def buildPacket(self, message):
         """Create a ready to send modbus packet.
@@ -232,11 +326,8 @@ class ModbusRtuFramer(ModbusFramer):
         :param message: The populated request/response to send
         """
         data = message.encode()
-        packet = (
-            struct.pack(RTU_FRAME_HEADER, message.slave_id, message.function_code)
-            + data
-        )
-        packet += struct.pack(">H", computeCRC(packet))
+        packet = _RTU_HDR.pack(message.slave_id, message.function_code) + data
+        packet += _U16_BE.pack(computeCRC(packet))
         # Ensure that transaction is actually the slave id for serial comms
         message.transaction_id = message.slave_id
         return packet
@@ -248,44 +339,47 @@ class ModbusRtuFramer(ModbusFramer):
         :return:
         """
         super().resetFrame()
-        start = time.time()
-        timeout = start + self.client.comm_params.timeout_connect
-        while self.client.state != ModbusTransactionState.IDLE:
-            if self.client.state == ModbusTransactionState.TRANSACTION_COMPLETE:
-                timestamp = round(time.time(), 6)
+        client = self.client
+        silent_interval = client.silent_interval
+        timeout_connect = client.comm_params.timeout_connect
+        start = time.monotonic()
+        timeout = start + timeout_connect
+        while (state := client.state) != ModbusTransactionState.IDLE:
+            if state == ModbusTransactionState.TRANSACTION_COMPLETE:
+                timestamp = time.monotonic()
                 Log.debug(
                     "Changing state to IDLE - Last Frame End - {} Current Time stamp - {}",
-                    self.client.last_frame_end,
+                    client.last_frame_end,
                     timestamp,
                 )
-                if self.client.last_frame_end:
-                    idle_time = self.client.idle_time()
-                    if round(timestamp - idle_time, 6) <= self.client.silent_interval:
+                if client.last_frame_end:
+                    # sleep once, just long enough to complete the 3.5 char gap
+                    if (delay := client.idle_time() - timestamp) > 0:
                         Log.debug(
                             "Waiting for 3.5 char before next send - {} ms",
-                            self.client.silent_interval * 1000,
+                            delay * 1000,
                         )
-                        time.sleep(self.client.silent_interval)
+                        time.sleep(delay)
                 else:
                     # Recovering from last error ??
-                    time.sleep(self.client.silent_interval)
-                self.client.state = ModbusTransactionState.IDLE
-            elif self.client.state == ModbusTransactionState.RETRYING:
+                    time.sleep(silent_interval)
+                client.state = ModbusTransactionState.IDLE
+            elif state == ModbusTransactionState.RETRYING:
                 # Simple lets settle down!!!
                 # To check for higher baudrates
-                time.sleep(self.client.comm_params.timeout_connect)
+                time.sleep(timeout_connect)
                 break
-            elif time.time() > timeout:
+            elif time.monotonic() > timeout:
                 Log.debug(
                     "Spent more time than the read time out, "
                     "resetting the transaction to IDLE"
                 )
-                self.client.state = ModbusTransactionState.IDLE
+                client.state = ModbusTransactionState.IDLE
             else:
                 Log.debug("Sleeping")
-                time.sleep(self.client.silent_interval)
-        size = self.client.send(message)
-        self.client.last_frame_end = round(time.time(), 6)
+                time.sleep(silent_interval)
+        size = client.send(message)
+        client.last_frame_end = time.monotonic()
         return size
 
     def recvPacket(self, size):
@@ -295,7 +389,7 @@ class ModbusRtuFramer(ModbusFramer):
         :return:
         """
         result = self.client.recv(size)
-        self.client.last_frame_end = round(time.time(), 6)
+        self.client.last_frame_end = time.monotonic()
         return result
 
     def _process(self, callback, error=False):
@@ -316,8 +410,9 @@ class ModbusRtuFramer(ModbusFramer):
         :raises IndexError: If not enough data to read byte count
         :return: Total frame size
         """
-        func_code = int(data[1])
-        pdu_class = self.decoder.lookupPduClass(func_code)
+        if self._lookups_current():
+            return self._rtu_size_fn[data[1]](data)
+        pdu_class = self.decoder.lookupPduClass(int(data[1]))
         return pdu_class.calculateRtuFrameSize(data)
 
 
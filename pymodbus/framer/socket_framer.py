@@ -11,6 +11,9 @@ from pymodbus.framer.base import SOCKET_FRAME_HEADER, ModbusFramer
 from pymodbus.logging import Log
 
 
+_MBAP = struct.Struct(">HHHB")
+_MBAP_FC = struct.Struct(SOCKET_FRAME_HEADER)
+
 # --------------------------------------------------------------------------- #
 # Modbus TCP Message
 # --------------------------------------------------------------------------- #
@@ -58,10 +61,10 @@ class ModbusSocketFramer(ModbusFramer):
         if 0 in slaves: # broadcast
             return True
         if self.transport is None:
-            return self._header["uid"] in slaves
+            return self._header.uid in slaves
         if (peer := self.transport.get_extra_info('peername')) is None:
-            return self._header["uid"] in slaves
-        slave_id: Tuple[str, int] = (peer[0], self._header["uid"])
+            return self._header.uid in slaves
+        slave_id: Tuple[str, int] = (peer[0], self._header.uid)
         return slave_id in slaves
 
     # ----------------------------------------------------------------------- #
@@ -72,20 +75,21 @@ class ModbusSocketFramer(ModbusFramer):
 
         Return true if we were successful.
         """
-        if not self.isFrameReady():
+        if (available := len(self._buffer) - self._hsize) <= 0:
             return False
+        header = self._header
         (
-            self._header["tid"],
-            self._header["pid"],
-            self._header["len"],
-            self._header["uid"],
-        ) = struct.unpack(">HHHB", self._buffer[0 : self._hsize])
+            header.tid,
+            header.pid,
+            header.len,
+            header.uid,
+        ) = _MBAP.unpack_from(self._buffer)
 
         # someone sent us an error? ignore it
-        if self._header["len"] < 2:
+        if header.len < 2:
             self.advanceFrame()
         # we have at least a complete message, continue
-        elif len(self._buffer) - self._hsize + 1 >= self._header["len"]:
+        elif available + 1 >= header.len:
             return True
         # we don't have enough of a message yet, wait
         return False
@@ -97,9 +101,9 @@ class ModbusSocketFramer(ModbusFramer):
         it or determined that it contains an error. It also has to reset the
         current frame header handle
         """
-        length = self._hsize + self._header["len"]
-        self._buffer = self._buffer[length:]
-        self._header = {"tid": 0, "pid": 0, "len": 0, "uid": 0}
+        length = self._hsize + self._header.len
+        del self._buffer[:length]
+        self._header.reset()
 
     def isFrameReady(self):
         """Check if we should continue decode logic.
@@ -116,8 +120,8 @@ class ModbusSocketFramer(ModbusFramer):
 
         :returns: The next full frame buffer
         """
-        length = self._hsize + self._header["len"]
-        return self._buffer[self._hsize : length]
+        length = self._hsize + self._header.len
+        return bytes(self._buffer[self._hsize : length])
 
     # ----------------------------------------------------------------------- #
     # Public Member Functions
@@ -125,9 +129,7 @@ class ModbusSocketFramer(ModbusFramer):
     def decode_data(self, data):
         """Decode data."""
         if len(data) > self._hsize:
-            tid, pid, length, uid, fcode = struct.unpack(
-                SOCKET_FRAME_HEADER, data[0 : self._hsize + 1]
-            )
+            tid, pid, length, uid, fcode = _MBAP_FC.unpack_from(data)
             return {
                 "tid": tid,
                 "pid": pid,
@@ -153,7 +155,7 @@ class ModbusSocketFramer(ModbusFramer):
             Log.debug("Frame check failed, ignoring!!")
             return
         if not self._validate_slave_id(slave, single):
-            header_txt = self._header["uid"]
+            header_txt = self._header.uid
             Log.debug("Not a valid slave id - {}, ignoring!!", header_txt)
             self.resetFrame()
             return
@@ -180,8 +182,7 @@ class ModbusSocketFramer(ModbusFramer):
         :param message: The populated request/response to send
         """
         data = message.encode()
-        packet = struct.pack(
-            SOCKET_FRAME_HEADER,
+        packet = _MBAP_FC.pack(
             message.transaction_id,
             message.protocol_id,
             len(data) + 2,
@@ -58,8 +58,8 @@ class ModbusTlsFramer(ModbusFramer):
         it or determined that it contains an error. It also has to reset the
         current frame header handle
         """
-        self._buffer = b""
-        self._header = {}
+        self._buffer = bytearray()
+        self._header.reset()
 
     def isFrameReady(self):
         """Check if we should continue decode logic.
@@ -76,7 +76,7 @@ class ModbusTlsFramer(ModbusFramer):
 
         :returns: The next full frame buffer
         """
-        return self._buffer[self._hsize :]
+        return bytes(self._buffer[self._hsize :])
 
     # ----------------------------------------------------------------------- #
     # Public Member Functions
@@ -28,7 +28,7 @@ from pymodbus.framer.rtu_framer import ModbusRtuFramer
 from pymodbus.framer.socket_framer import ModbusSocketFramer
 from pymodbus.framer.tls_framer import ModbusTlsFramer
 from pymodbus.logging import Log
-from pymodbus.utilities import ModbusTransactionState, hexlify_packets
+from pymodbus.utilities import ModbusTransactionState
 
 
 # --------------------------------------------------------------------------- #
@@ -133,10 +133,8 @@ class ModbusTransactionManager:
                 retries = self.retries
                 request.transaction_id = self.getNextTID()
                 Log.debug("Running transaction {}", request.transaction_id)
-                if _buffer := hexlify_packets(
-                    self.client.framer._buffer  # pylint: disable=protected-access
-                ):
-                    Log.debug("Clearing current Frame: - {}", _buffer)
+                if _buffer := self.client.framer._buffer:  # pylint: disable=protected-access
+                    Log.debug("Clearing current Frame: - {}", _buffer, ":hex")
                     self.client.framer.resetFrame()
                 if broadcast := (
                     self.client.params.broadcast_enable and not request.slave_id
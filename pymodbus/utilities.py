@@ -169,7 +169,7 @@ def __generate_crc16_table():
                 crc >>= 1
             byte >>= 1
         result.append(crc)
-    return result
+    return tuple(result)
 
 
 __crc16_table = __generate_crc16_table()
@@ -184,15 +184,14 @@ def computeCRC(data):  # pylint: disable=invalid-name
     The difference between modbus's crc16 and a normal crc16
     is that modbus starts the crc value out at 0xffff.
 
-    :param data: The data to create a crc16 of
+    :param data: The data to create a crc16 of (bytes, bytearray or memoryview)
     :returns: The calculated CRC
     """
     crc = 0xFFFF
+    table = __crc16_table
     for data_byte in data:
-        idx = __crc16_table[(crc ^ int(data_byte)) & 0xFF]
-        crc = ((crc >> 8) & 0xFF) ^ idx
-    swapped = ((crc << 8) & 0xFF00) | ((crc >> 8) & 0x00FF)
-    return swapped
+        crc = (crc >> 8) ^ table[(crc ^ data_byte) & 0xFF]
+    return ((crc << 8) & 0xFF00) | (crc >> 8)
 
 
 def checkCRC(data, check):  # pylint: disable=invalid-name
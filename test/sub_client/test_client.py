@@ -26,192 +26,188 @@ from pymodbus.transport import CommType
 BASE_PORT = 6500
 
 
-@pytest.mark.parametrize(
-    "arglist",
-    [
-        [
-            {},
-            {"address": 0x01},
-            {"address": 0x01, "value": False},
-            {"msg": b"long message"},
-            {"toggle": False},
-            {"address": 0x01, "values": [False, True]},
-            {"address": 0x01, "values": [22, 44]},
-            {"records": (0, 0)},
-        ]
-    ],
-)
-@pytest.mark.parametrize(
-    ("method", "arg", "pdu_request"),
-    [
-        ("read_coils", 1, pdu_bit_read.ReadCoilsRequest),
-        ("read_discrete_inputs", 1, pdu_bit_read.ReadDiscreteInputsRequest),
-        ("read_holding_registers", 1, pdu_reg_read.ReadHoldingRegistersRequest),
-        ("read_input_registers", 1, pdu_reg_read.ReadInputRegistersRequest),
-        ("write_coil", 2, pdu_bit_write.WriteSingleCoilRequest),
-        ("write_register", 2, pdu_req_write.WriteSingleRegisterRequest),
-        ("read_exception_status", 0, pdu_other_msg.ReadExceptionStatusRequest),
-        ("diag_query_data", 3, pdu_diag.ReturnQueryDataRequest),
-        ("diag_restart_communication", 4, pdu_diag.RestartCommunicationsOptionRequest),
-        ("diag_read_diagnostic_register", 0, pdu_diag.ReturnDiagnosticRegisterRequest),
-        (
-            "diag_change_ascii_input_delimeter",
-            0,
-            pdu_diag.ChangeAsciiInputDelimiterRequest,
-        ),
-        ("diag_force_listen_only", 0, pdu_diag.ForceListenOnlyModeRequest),
-        ("diag_clear_counters", 0, pdu_diag.ClearCountersRequest),
-        ("diag_read_bus_message_count", 0, pdu_diag.ReturnBusMessageCountRequest),
-        (
-            "diag_read_bus_comm_error_count",
-            0,
-            pdu_diag.ReturnBusCommunicationErrorCountRequest,
-        ),
-        (
-            "diag_read_bus_exception_error_count",
-            0,
-            pdu_diag.ReturnBusExceptionErrorCountRequest,
-        ),
-        ("diag_read_slave_message_count", 0, pdu_diag.ReturnSlaveMessageCountRequest),
-        (
-            "diag_read_slave_no_response_count",
-            0,
-            pdu_diag.ReturnSlaveNoResponseCountRequest,
-        ),
-        ("diag_read_slave_nak_count", 0, pdu_diag.ReturnSlaveNAKCountRequest),
-        ("diag_read_slave_busy_count", 0, pdu_diag.ReturnSlaveBusyCountRequest),
-        (
-            "diag_read_bus_char_overrun_count",
-            0,
-            pdu_diag.ReturnSlaveBusCharacterOverrunCountRequest,
-        ),
-        ("diag_read_iop_overrun_count", 0, pdu_diag.ReturnIopOverrunCountRequest),
-        ("diag_clear_overrun_counter", 0, pdu_diag.ClearOverrunCountRequest),
-        ("diag_getclear_modbus_response", 0, pdu_diag.GetClearModbusPlusRequest),
-        ("write_coils", 5, pdu_bit_write.WriteMultipleCoilsRequest),
-        ("write_registers", 6, pdu_req_write.WriteMultipleRegistersRequest),
-        ("readwrite_registers", 1, pdu_reg_read.ReadWriteMultipleRegistersRequest),
-        ("mask_write_register", 1, pdu_req_write.MaskWriteRegisterRequest),
-        ("report_slave_id", 0, pdu_other_msg.ReportSlaveIdRequest),
-        ("read_file_record", 7, pdu_file_msg.ReadFileRecordRequest),
-        ("write_file_record", 7, pdu_file_msg.WriteFileRecordRequest),
-        ("read_fifo_queue", 1, pdu_file_msg.ReadFifoQueueRequest),
-    ],
-)
-def test_client_mixin(arglist, method, arg, pdu_request):
+MIXIN_ARGS = [
+    {},
+    {"address": 0x01},
+    {"address": 0x01, "value": False},
+    {"msg": b"long message"},
+    {"toggle": False},
+    {"address": 0x01, "values": [False, True]},
+    {"address": 0x01, "values": [22, 44]},
+    {"records": (0, 0)},
+]
+MIXIN_CASES = [
+    ("read_coils", 1, pdu_bit_read.ReadCoilsRequest),
+    ("read_discrete_inputs", 1, pdu_bit_read.ReadDiscreteInputsRequest),
+    ("read_holding_registers", 1, pdu_reg_read.ReadHoldingRegistersRequest),
+    ("read_input_registers", 1, pdu_reg_read.ReadInputRegistersRequest),
+    ("write_coil", 2, pdu_bit_write.WriteSingleCoilRequest),
+    ("write_register", 2, pdu_req_write.WriteSingleRegisterRequest),
+    ("read_exception_status", 0, pdu_other_msg.ReadExceptionStatusRequest),
+    ("diag_query_data", 3, pdu_diag.ReturnQueryDataRequest),
+    ("diag_restart_communication", 4, pdu_diag.RestartCommunicationsOptionRequest),
+    ("diag_read_diagnostic_register", 0, pdu_diag.ReturnDiagnosticRegisterRequest),
+    (
+        "diag_change_ascii_input_delimeter",
+        0,
+        pdu_diag.ChangeAsciiInputDelimiterRequest,
+    ),
+    ("diag_force_listen_only", 0, pdu_diag.ForceListenOnlyModeRequest),
+    ("diag_clear_counters", 0, pdu_diag.ClearCountersRequest),
+    ("diag_read_bus_message_count", 0, pdu_diag.ReturnBusMessageCountRequest),
+    (
+        "diag_read_bus_comm_error_count",
+        0,
+        pdu_diag.ReturnBusCommunicationErrorCountRequest,
+    ),
+    (
+        "diag_read_bus_exception_error_count",
+        0,
+        pdu_diag.ReturnBusExceptionErrorCountRequest,
+    ),
+    ("diag_read_slave_message_count", 0, pdu_diag.ReturnSlaveMessageCountRequest),
+    (
+        "diag_read_slave_no_response_count",
+        0,
+        pdu_diag.ReturnSlaveNoResponseCountRequest,
+    ),
+    ("diag_read_slave_nak_count", 0, pdu_diag.ReturnSlaveNAKCountRequest),
+    ("diag_read_slave_busy_count", 0, pdu_diag.ReturnSlaveBusyCountRequest),
+    (
+        "diag_read_bus_char_overrun_count",
+        0,
+        pdu_diag.ReturnSlaveBusCharacterOverrunCountRequest,
+    ),
+    ("diag_read_iop_overrun_count", 0, pdu_diag.ReturnIopOverrunCountRequest),
+    ("diag_clear_overrun_counter", 0, pdu_diag.ClearOverrunCountRequest),
+    ("diag_getclear_modbus_response", 0, pdu_diag.GetClearModbusPlusRequest),
+    ("write_coils", 5, pdu_bit_write.WriteMultipleCoilsRequest),
+    ("write_registers", 6, pdu_req_write.WriteMultipleRegistersRequest),
+    ("readwrite_registers", 1, pdu_reg_read.ReadWriteMultipleRegistersRequest),
+    ("mask_write_register", 1, pdu_req_write.MaskWriteRegisterRequest),
+    ("report_slave_id", 0, pdu_other_msg.ReportSlaveIdRequest),
+    ("read_file_record", 7, pdu_file_msg.ReadFileRecordRequest),
+    ("write_file_record", 7, pdu_file_msg.WriteFileRecordRequest),
+    ("read_fifo_queue", 1, pdu_file_msg.ReadFifoQueueRequest),
+]
+
+
+def test_client_mixin():
     """Test mixin responses."""
     pdu_to_call = None
 
-    def fake_execute(_self, request):
-        """Set PDU request."""
-        nonlocal pdu_to_call
-        pdu_to_call = request
-
-    with mock.patch.object(ModbusClientMixin, "execute", fake_execute):
-        getattr(ModbusClientMixin(), method)(**arglist[arg])
-        assert isinstance(pdu_to_call, pdu_request)
+    class FakeClient(ModbusClientMixin):  # pylint: disable=too-few-public-methods
+        """Client mixin recording the request, instead of patching the mixin class."""
+
+        def execute(self, _request):
+            """Set PDU request."""
+            nonlocal pdu_to_call
+            pdu_to_call = _request
+
+    client = FakeClient()
+    for method, arg, pdu_request in MIXIN_CASES:
+        getattr(client, method)(**MIXIN_ARGS[arg])
+        assert isinstance(pdu_to_call, pdu_request), method
+
+
+# plain dicts, the values are passed on as client keyword arguments
+_ARG_LIST = {  # pylint: disable=consider-using-namedtuple-or-dataclass
+    "fix": {
+        "opt_args": {
+            "timeout": 5,
+            "retries": 5,
+            "retry_on_empty": True,
+            "close_comm_on_error": True,
+            "strict": False,
+            "broadcast_enable": True,
+            "reconnect_delay": 117,
+            "reconnect_delay_max": 250,
+        },
+        "defaults": {
+            "timeout": 3,
+            "retries": 3,
+            "retry_on_empty": False,
+            "close_comm_on_error": False,
+            "strict": True,
+            "broadcast_enable": False,
+            "reconnect_delay": 100,
+            "reconnect_delay_max": 300000,
+        },
+    },
+    "serial": {
+        "pos_arg": "/dev/tty",
+        "opt_args": {
+            "framer": Framer.ASCII,
+            "baudrate": 19700,
+            "bytesize": 7,
+            "parity": "E",
+            "stopbits": 2,
+            "handle_local_echo": True,
+        },
+        "defaults": {
+            "host": None,
+            "port": "/dev/tty",
+            "framer": Framer.RTU,
+            "baudrate": 19200,
+            "bytesize": 8,
+            "parity": "N",
+            "stopbits": 1,
+            "handle_local_echo": False,
+        },
+    },
+    "tcp": {
+        "pos_arg": "192.168.1.2",
+        "opt_args": {
+            "port": 112,
+            "framer": Framer.ASCII,
+            "source_address": ("195.6.7.8", 1025),
+        },
+        "defaults": {
+            "host": "192.168.1.2",
+            "port": 502,
+            "framer": Framer.SOCKET,
+            "source_address": None,
+        },
+    },
+    "tls": {
+        "pos_arg": "192.168.1.2",
+        "opt_args": {
+            "port": 211,
+            "framer": Framer.ASCII,
+            "source_address": ("195.6.7.8", 1025),
+            "sslctx": None,
+            "certfile": None,
+            "keyfile": None,
+            "password": None,
+        },
+        "defaults": {
+            "host": "192.168.1.2",
+            "port": 802,
+            "framer": Framer.TLS,
+            "source_address": None,
+            "sslctx": None,
+            "certfile": None,
+            "keyfile": None,
+            "password": None,
+        },
+    },
+    "udp": {
+        "pos_arg": "192.168.1.2",
+        "opt_args": {
+            "port": 121,
+            "framer": Framer.ASCII,
+            "source_address": ("195.6.7.8", 1025),
+        },
+        "defaults": {
+            "host": "192.168.1.2",
+            "port": 502,
+            "framer": Framer.SOCKET,
+            "source_address": None,
+        },
+    },
+}
 
 
-@pytest.mark.parametrize(
-    "arg_list",
-    [
-        {
-            "fix": {
-                "opt_args": {
-                    "timeout": 3 + 2,
-                    "retries": 3 + 2,
-                    "retry_on_empty": True,
-                    "close_comm_on_error": True,
-                    "strict": False,
-                    "broadcast_enable": not False,
-                    "reconnect_delay": 117,
-                    "reconnect_delay_max": 250,
-                },
-                "defaults": {
-                    "timeout": 3,
-                    "retries": 3,
-                    "retry_on_empty": False,
-                    "close_comm_on_error": False,
-                    "strict": True,
-                    "broadcast_enable": False,
-                    "reconnect_delay": 100,
-                    "reconnect_delay_max": 1000 * 60 * 5,
-                },
-            },
-            "serial": {
-                "pos_arg": "/dev/tty",
-                "opt_args": {
-                    "framer": Framer.ASCII,
-                    "baudrate": 19200 + 500,
-                    "bytesize": 8 - 1,
-                    "parity": "E",
-                    "stopbits": 1 + 1,
-                    "handle_local_echo": True,
-                },
-                "defaults": {
-                    "host": None,
-                    "port": "/dev/tty",
-                    "framer": Framer.RTU,
-                    "baudrate": 19200,
-                    "bytesize": 8,
-                    "parity": "N",
-                    "stopbits": 1,
-                    "handle_local_echo": False,
-                },
-            },
-            "tcp": {
-                "pos_arg": "192.168.1.2",
-                "opt_args": {
-                    "port": 112,
-                    "framer": Framer.ASCII,
-                    "source_address": ("195.6.7.8", 1025),
-                },
-                "defaults": {
-                    "host": "192.168.1.2",
-                    "port": 502,
-                    "framer": Framer.SOCKET,
-                    "source_address": None,
-                },
-            },
-            "tls": {
-                "pos_arg": "192.168.1.2",
-                "opt_args": {
-                    "port": 211,
-                    "framer": Framer.ASCII,
-                    "source_address": ("195.6.7.8", 1025),
-                    "sslctx": None,
-                    "certfile": None,
-                    "keyfile": None,
-                    "password": None,
-                },
-                "defaults": {
-                    "host": "192.168.1.2",
-                    "port": 802,
-                    "framer": Framer.TLS,
-                    "source_address": None,
-                    "sslctx": None,
-                    "certfile": None,
-                    "keyfile": None,
-                    "password": None,
-                },
-            },
-            "udp": {
-                "pos_arg": "192.168.1.2",
-                "opt_args": {
-                    "port": 121,
-                    "framer": Framer.ASCII,
-                    "source_address": ("195.6.7.8", 1025),
-                },
-                "defaults": {
-                    "host": "192.168.1.2",
-                    "port": 502,
-                    "framer": Framer.SOCKET,
-                    "source_address": None,
-                },
-            },
-        },
-    ],
-)
 @pytest.mark.parametrize(
     ("type_args", "clientclass"),
     [
@@ -224,26 +220,26 @@ def test_client_mixin(arglist, method, arg, pdu_request):
         ("udp", lib_client.AsyncModbusUdpClient),
         ("udp", lib_client.ModbusUdpClient),
     ],
+    ids=["tcp-async", "tcp-sync", "tls-async", "tls-sync", "udp-async", "udp-sync"],
 )
 @pytest.mark.parametrize("test_default", [True, False])
 async def test_client_instanciate(
-    arg_list,
     type_args,
     clientclass,
     test_default,
 ):
     """Try to instantiate clients."""
-    cur_args = arg_list[type_args]
+    cur_args = _ARG_LIST[type_args]
     if test_default:
         client = clientclass(cur_args["pos_arg"])
-        to_test = dict(arg_list["fix"]["defaults"], **cur_args["defaults"])
+        to_test = dict(_ARG_LIST["fix"]["defaults"], **cur_args["defaults"])
     else:
         client = clientclass(
             cur_args["pos_arg"],
-            **arg_list["fix"]["opt_args"],
+            **_ARG_LIST["fix"]["opt_args"],
             **cur_args["opt_args"],
         )
-        to_test = dict(arg_list["fix"]["opt_args"], **cur_args["opt_args"])
+        to_test = dict(_ARG_LIST["fix"]["opt_args"], **cur_args["opt_args"])
         to_test["host"] = cur_args["defaults"]["host"]
 
     # Test information methods
@@ -253,11 +249,6 @@ async def test_client_instanciate(
     client.last_frame_end = None
     assert not client.idle_time()
 
-    # a successful execute
-    client.connect = lambda: True
-    client.transport = lambda: None
-    client.transaction = mock.Mock(**{"execute.return_value": True})
-
     # a unsuccessful connect
     client.connect = lambda: False
     client.transport = None
@@ -299,15 +290,10 @@ async def test_client_connection_made():
 async def test_client_base_async():
     """Test modbus base client class."""
     with mock.patch(
-        "pymodbus.client.base.ModbusBaseClient.connect"
-    ) as p_connect, mock.patch(
-        "pymodbus.client.base.ModbusBaseClient.close"
-    ) as p_close:
-        asyncio.get_event_loop()
-        p_connect.return_value = asyncio.Future()
-        p_connect.return_value.set_result(True)
-        p_close.return_value = asyncio.Future()
-        p_close.return_value.set_result(True)
+        "pymodbus.client.base.ModbusBaseClient.connect",
+        new_callable=mock.AsyncMock,
+        return_value=True,
+    ), mock.patch("pymodbus.client.base.ModbusBaseClient.close"):
         async with ModbusBaseClient(
             Framer.ASCII,
             host="localhost",
@@ -315,46 +301,6 @@ async def test_client_base_async():
             CommType=CommType.TCP,
         ) as client:
             str(client)
-        p_connect.return_value = asyncio.Future()
-        p_connect.return_value.set_result(False)
-        p_close.return_value = asyncio.Future()
-        p_close.return_value.set_result(False)
-
-
-@pytest.mark.skip()
-async def test_client_protocol_receiver():
-    """Test the client protocol data received."""
-    base = ModbusBaseClient(Framer.SOCKET)
-    transport = mock.MagicMock()
-    base.connection_made(transport)
-    assert base.transport == transport
-    assert base.transport
-    data = b"\x00\x00\x12\x34\x00\x06\xff\x01\x01\x02\x00\x04"
-
-    # setup existing request
-    assert not list(base.transaction)
-    response = base.build_response(0x00)  # pylint: disable=protected-access
-    base.data_received(data)
-    result = response.result()
-    assert isinstance(result, pdu_bit_read.ReadCoilsResponse)
-
-    base.transport = None
-    with pytest.raises(ConnectionException):
-        await base.build_response(0x00)  # pylint: disable=protected-access
-
-
-@pytest.mark.skip()
-async def test_client_protocol_response():
-    """Test the udp client protocol builds responses."""
-    base = ModbusBaseClient(Framer.SOCKET)
-    response = base.build_response(0x00)  # pylint: disable=protected-access
-    excp = response.exception()
-    assert isinstance(excp, ConnectionException)
-    assert not list(base.transaction)
-
-    base.transport = lambda: None
-    base.build_response(0x00)  # pylint: disable=protected-access
-    assert len(list(base.transaction)) == 1
 
 
 async def test_client_protocol_handler():
@@ -374,6 +320,10 @@ async def test_client_protocol_handler():
     assert result == reply
 
 
+_DB = ModbusSequentialDataBlock(0, [0] * 100)
+_SHARED_CTX = ModbusSlaveContext(di=_DB, co=_DB, hr=_DB, ir=_DB)  # only read from
+
+
 class MockTransport:
     """Mock transport class which responds with an appropriate encoded packet."""
 
@@ -381,14 +331,12 @@ class MockTransport:
         """Initialize MockTransport."""
         self.base = base
         self.retries = retries
-
-        db = ModbusSequentialDataBlock(0, [0] * 100)
-        self.ctx = ModbusSlaveContext(di=db, co=db, hr=db, ir=db)
+        self.ctx = _SHARED_CTX
         self.req = req
 
     async def delayed_resp(self):
         """Send a response to a received packet."""
-        await asyncio.sleep(0.05)
+        await asyncio.sleep(0)
         resp = self.req.execute(self.ctx)
         pkt = self.base.framer.buildPacket(resp)
         self.base.data_received(pkt)
@@ -443,7 +391,7 @@ async def test_client_protocol_retry():
 
 async def test_client_protocol_timeout():
     """Test the client protocol execute method with timeout."""
-    base = ModbusBaseClient(Framer.SOCKET, host="127.0.0.1", timeout=0.1, retries=2)
+    base = ModbusBaseClient(Framer.SOCKET, host="127.0.0.1", timeout=0.001, retries=2)
     # Avoid creating do_reconnect() task
     base.connection_lost = mock.MagicMock()
     request = pdu_bit_read.ReadCoilsRequest(1, 1)
@@ -455,130 +403,135 @@ async def test_client_protocol_timeout():
     assert transport.retries == 1
 
 
-def test_client_udp_connect():
-    """Test the Udp client connection method."""
-    with mock.patch.object(socket, "socket") as mock_method:
+class _DummySocket:
+    """Dummy socket, lighter than a MagicMock."""
 
-        class DummySocket:
-            """Dummy socket."""
+    fileno = 1
 
-            fileno = 1
+    def settimeout(self, *a, **kwa):
+        """Set timeout."""
 
-            def settimeout(self, *a, **kwa):
-                """Set timeout."""
+    def setblocking(self, _flag):
+        """Set blocking."""
 
-            def setblocking(self, _flag):
-                """Set blocking."""
-
-        mock_method.return_value = DummySocket()
-        client = lib_client.ModbusUdpClient("127.0.0.1")
-        assert client.connect()
-
-    with mock.patch.object(socket, "socket") as mock_method:
-        mock_method.side_effect = OSError()
-        client = lib_client.ModbusUdpClient("127.0.0.1")
-        assert not client.connect()
+    def getsockname(self):
+        """Get socket name."""
+        return ("dmmy", 1234)
 
-
-def test_client_tcp_connect():
-    """Test the tcp client connection method."""
-    with mock.patch.object(socket, "create_connection") as mock_method:
-        _socket = mock.MagicMock()
-        mock_method.return_value = _socket
-        client = lib_client.ModbusTcpClient("127.0.0.1")
-        _socket.getsockname.return_value = ("dmmy", 1234)
+    def close(self):
+        """Close."""
+
+
+def _dummy_socket(*_args, **_kwargs):
+    """Return a dummy socket, replaces socket.socket/socket.create_connection."""
+    return _DummySocket()
+
+
+def _dummy_connect(_self, _address):
+    """Connect nothing, replaces ssl.SSLSocket.connect."""
+
+
+CONNECT_CASES = [
+    pytest.param(
+        lib_client.ModbusUdpClient, {}, (socket, "socket"), _dummy_socket, id="udp"
+    ),
+    pytest.param(
+        lib_client.ModbusTcpClient,
+        {},
+        (socket, "create_connection"),
+        _dummy_socket,
+        id="tcp",
+    ),
+    pytest.param(
+        lib_client.ModbusTlsClient,
+        {},
+        (ssl.SSLSocket, "connect"),
+        _dummy_connect,
+        id="tls",
+    ),
+    pytest.param(
+        lib_client.ModbusTlsClient,
+        {"source_address": ("0.0.0.0", 0)},
+        (ssl.SSLSocket, "connect"),
+        _dummy_connect,
+        id="tls-source-address",
+    ),
+]
+
+
+@pytest.mark.parametrize(("clientclass", "kwargs", "target", "stub"), CONNECT_CASES)
+def test_client_connect(clientclass, kwargs, target, stub):
+    """Test the client connection method, with the socket layer patched."""
+    with mock.patch.object(*target, stub):
+        client = clientclass("127.0.0.1", **kwargs)
         assert client.connect()
+    client.close()
 
-    with mock.patch.object(socket, "create_connection") as mock_method:
-        mock_method.side_effect = OSError()
-        client = lib_client.ModbusTcpClient("127.0.0.1")
+    with mock.patch.object(*target, side_effect=OSError()):
+        client = clientclass("127.0.0.1", **kwargs)
         assert not client.connect()
 
 
 def test_client_tcp_reuse():
     """Test the tcp client connection method."""
-    with mock.patch.object(socket, "create_connection") as mock_method:
-        _socket = mock.MagicMock()
-        mock_method.return_value = _socket
+    with mock.patch.object(socket, "create_connection", _dummy_socket):
         client = lib_client.ModbusTcpClient("127.0.0.1")
-        _socket.getsockname.return_value = ("dmmy", 1234)
         assert client.connect()
     client.close()
-    with mock.patch.object(socket, "create_connection") as mock_method:
-        _socket = mock.MagicMock()
-        mock_method.return_value = _socket
+    with mock.patch.object(socket, "create_connection", _dummy_socket):
         client = lib_client.ModbusTcpClient("127.0.0.1")
-        _socket.getsockname.return_value = ("dmmy", 1234)
         assert client.connect()
     client.close()
 
 
-def test_client_tls_connect():
-    """Test the tls client connection method."""
-    with mock.patch.object(ssl.SSLSocket, "connect") as mock_method:
-        client = lib_client.ModbusTlsClient("127.0.0.1")
-        assert client.connect()
-
-    with mock.patch.object(socket, "create_connection") as mock_method:
-        mock_method.side_effect = OSError()
-        client = lib_client.ModbusTlsClient("127.0.0.1")
-        assert not client.connect()
-
-
-def test_client_tls_connect2():
-    """Test the tls client connection method."""
-    with mock.patch.object(ssl.SSLSocket, "connect") as mock_method:
-        client = lib_client.ModbusTlsClient("127.0.0.1", source_address=("0.0.0.0", 0))
-        assert client.connect()
-
-    with mock.patch.object(socket, "create_connection") as mock_method:
-        mock_method.side_effect = OSError()
-        client = lib_client.ModbusTlsClient("127.0.0.1")
-        assert not client.connect()
-
-
-@pytest.mark.parametrize(
-    ("datatype", "value", "registers"),
-    [
-        (ModbusClientMixin.DATATYPE.STRING, "abcd", [0x6162, 0x6364]),
-        (ModbusClientMixin.DATATYPE.STRING, "a", [0x6100]),
-        (ModbusClientMixin.DATATYPE.UINT16, 27123, [0x69F3]),
-        (ModbusClientMixin.DATATYPE.INT16, -27123, [0x960D]),
-        (ModbusClientMixin.DATATYPE.UINT32, 27123, [0x0000, 0x69F3]),
-        (ModbusClientMixin.DATATYPE.UINT32, 32145678, [0x01EA, 0x810E]),
-        (ModbusClientMixin.DATATYPE.INT32, -32145678, [0xFE15, 0x7EF2]),
-        (
-            ModbusClientMixin.DATATYPE.UINT64,
-            1234567890123456789,
-            [0x1122, 0x10F4, 0x7DE9, 0x8115],
-        ),
-        (
-            ModbusClientMixin.DATATYPE.INT64,
-            -1234567890123456789,
-            [0xEEDD, 0xEF0B, 0x8216, 0x7EEB],
-        ),
-        (ModbusClientMixin.DATATYPE.FLOAT32, 27123.5, [0x46D3, 0xE700]),
-        (ModbusClientMixin.DATATYPE.FLOAT32, 3.141592, [0x4049, 0x0FD8]),
-        (ModbusClientMixin.DATATYPE.FLOAT32, -3.141592, [0xC049, 0x0FD8]),
-        (ModbusClientMixin.DATATYPE.FLOAT64, 27123.5, [0x40DA, 0x7CE0, 0x0000, 0x0000]),
-        (
-            ModbusClientMixin.DATATYPE.FLOAT64,
-            3.14159265358979,
-            [0x4009, 0x21FB, 0x5444, 0x2D11],
-        ),
-        (
-            ModbusClientMixin.DATATYPE.FLOAT64,
-            -3.14159265358979,
-            [0xC009, 0x21FB, 0x5444, 0x2D11],
-        ),
-    ],
-)
+DT = ModbusClientMixin.DATATYPE
+CONVERT_CASES = [
+    pytest.param(DT.STRING, "abcd", [0x6162, 0x6364], id="str-abcd"),
+    pytest.param(DT.STRING, "a", [0x6100], id="str-a"),
+    pytest.param(DT.UINT16, 27123, [0x69F3], id="u16"),
+    pytest.param(DT.INT16, -27123, [0x960D], id="i16"),
+    pytest.param(DT.UINT32, 27123, [0x0000, 0x69F3], id="u32-small"),
+    pytest.param(DT.UINT32, 32145678, [0x01EA, 0x810E], id="u32"),
+    pytest.param(DT.INT32, -32145678, [0xFE15, 0x7EF2], id="i32"),
+    pytest.param(
+        DT.UINT64, 1234567890123456789, [0x1122, 0x10F4, 0x7DE9, 0x8115], id="u64"
+    ),
+    pytest.param(
+        DT.INT64, -1234567890123456789, [0xEEDD, 0xEF0B, 0x8216, 0x7EEB], id="i64"
+    ),
+    pytest.param(DT.FLOAT64, 27123.5, [0x40DA, 0x7CE0, 0x0000, 0x0000], id="f64"),
+    pytest.param(
+        DT.FLOAT64, 3.14159265358979, [0x4009, 0x21FB, 0x5444, 0x2D11], id="f64-pi"
+    ),
+    pytest.param(
+        DT.FLOAT64,
+        -3.14159265358979,
+        [0xC009, 0x21FB, 0x5444, 0x2D11],
+        id="f64-neg-pi",
+    ),
+]
+CONVERT_FLOAT32_CASES = [
+    pytest.param(27123.5, [0x46D3, 0xE700], id="f32"),
+    pytest.param(3.141592, [0x4049, 0x0FD8], id="f32-pi"),
+    pytest.param(-3.141592, [0xC049, 0x0FD8], id="f32-neg-pi"),
+]
+
+
+@pytest.mark.parametrize(("datatype", "value", "registers"), CONVERT_CASES)
 def test_client_mixin_convert(datatype, registers, value):
     """Test converter methods."""
     regs = ModbusClientMixin.convert_to_registers(value, datatype)
     result = ModbusClientMixin.convert_from_registers(regs, datatype)
-    if datatype == ModbusClientMixin.DATATYPE.FLOAT32:
-        result = round(result, 6)
+    assert regs == registers
+    assert result == value
+
+
+@pytest.mark.parametrize(("value", "registers"), CONVERT_FLOAT32_CASES)
+def test_client_mixin_convert_float32(registers, value):
+    """Test float32 converter, the value is rounded to the float32 precision."""
+    datatype = DT.FLOAT32
+    regs = ModbusClientMixin.convert_to_registers(value, datatype)
+    result = round(ModbusClientMixin.convert_from_registers(regs, datatype), 6)
     assert regs == registers
     assert result == value
 
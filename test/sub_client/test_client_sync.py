@@ -15,6 +15,7 @@ from pymodbus.client import (
     ModbusUdpClient,
 )
 from pymodbus.exceptions import ConnectionException
+from pymodbus.pdu import ModbusResponse
 from pymodbus.transaction import (
     ModbusAsciiFramer,
     ModbusBinaryFramer,
@@ -302,6 +303,23 @@ class TestSynchronousClient:  # pylint: disable=too-many-public-methods
     # -----------------------------------------------------------------------#
     # Test Serial Client
     # -----------------------------------------------------------------------#
+    def test_serial_client_register(self):
+        """Test serial client register updates the rtu framer."""
+
+        class CustomResponse(ModbusResponse):
+            """Dummy custom response."""
+
+            function_code = 0x55
+            _rtu_frame_size = 4
+
+        message = b"\x01\x55\xc0\x1f"
+        client = ModbusSerialClient("/dev/null", framer=Framer.RTU)
+        client.framer._buffer = bytearray(message)  # pylint: disable=protected-access
+        assert not client.framer.getFrameStart([1], False, False)
+        client.register(CustomResponse)
+        client.framer._buffer = bytearray(message)  # pylint: disable=protected-access
+        assert client.framer.getFrameStart([1], False, False)
+
     def test_sync_serial_client_instantiation(self):
         """Test sync serial client."""
         client = ModbusSerialClient("/dev/null")
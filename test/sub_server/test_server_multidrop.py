@@ -144,26 +144,40 @@ class TestMultidrop:
     def test_getFrameStart(self, framer):
         """Test getFrameStart."""
         framer_ok = b"\x02\x03\x00\x01\x00}\xd4\x18"
-        framer._buffer = framer_ok  # pylint: disable=protected-access
+        framer._buffer = bytearray(framer_ok)  # pylint: disable=protected-access
         assert framer.getFrameStart(self.slaves, False, False)
         assert framer_ok == framer._buffer  # pylint: disable=protected-access
 
         framer_2ok = framer_ok + framer_ok
-        framer._buffer = framer_2ok  # pylint: disable=protected-access
+        framer._buffer = bytearray(framer_2ok)  # pylint: disable=protected-access
         assert framer.getFrameStart(self.slaves, False, False)
         assert framer_2ok == framer._buffer  # pylint: disable=protected-access
         assert framer.getFrameStart(self.slaves, False, True)
         assert framer_ok == framer._buffer  # pylint: disable=protected-access
 
-        framer._buffer = framer_ok[:2]  # pylint: disable=protected-access
+        framer._buffer = bytearray(framer_ok[:2])  # pylint: disable=protected-access
         assert not framer.getFrameStart(self.slaves, False, False)
         assert framer_ok[:2] == framer._buffer  # pylint: disable=protected-access
 
-        framer._buffer = framer_ok[:3]  # pylint: disable=protected-access
+        framer._buffer = bytearray(framer_ok[:3])  # pylint: disable=protected-access
         assert not framer.getFrameStart(self.slaves, False, False)
         assert framer_ok[:3] == framer._buffer  # pylint: disable=protected-access
 
         framer_ok = b"\xF0\x03\x00\x01\x00}\xd4\x18"
-        framer._buffer = framer_ok  # pylint: disable=protected-access
+        framer._buffer = bytearray(framer_ok)  # pylint: disable=protected-access
         assert not framer.getFrameStart(self.slaves, False, False)
         assert framer._buffer == framer_ok[-3:]  # pylint: disable=protected-access
+
+        garbage = b"\xF0\xF2\x02\xF1\x01"  # contains slave id 2, but no function code after it
+        framer._buffer = bytearray(garbage + self.good_frame)  # pylint: disable=protected-access
+        assert framer.getFrameStart(self.slaves, False, False)
+        assert framer._buffer == self.good_frame  # pylint: disable=protected-access
+        framer._buffer = bytearray(garbage + self.good_frame)  # pylint: disable=protected-access
+        assert framer.getFrameStart([7, 2], False, False)
+        assert framer._buffer == self.good_frame  # pylint: disable=protected-access
+        framer._buffer = bytearray(garbage + self.good_frame)  # pylint: disable=protected-access
+        assert framer.getFrameStart([0], True, False)
+        assert framer._buffer == garbage[1:] + self.good_frame  # pylint: disable=protected-access
+        framer._buffer = bytearray(self.good_frame + garbage + self.good_frame)  # pylint: disable=protected-access
+        assert framer.getFrameStart([7, 2], False, True)
+        assert framer._buffer == self.good_frame  # pylint: disable=protected-access
@@ -7,13 +7,14 @@ from pymodbus import Framer
 from pymodbus.bit_read_message import ReadCoilsRequest
 from pymodbus.client.base import ModbusBaseClient
 from pymodbus.exceptions import ModbusIOException
-from pymodbus.factory import ClientDecoder
+from pymodbus.factory import ClientDecoder, ServerDecoder
 from pymodbus.framer import (
     ModbusAsciiFramer,
     ModbusBinaryFramer,
     ModbusRtuFramer,
     ModbusSocketFramer,
 )
+from pymodbus.pdu import ModbusRequest, ModbusResponse
 from pymodbus.transport import CommType
 from pymodbus.utilities import ModbusTransactionState
 
@@ -24,6 +25,26 @@ BASE_PORT = 6600
 TEST_MESSAGE = b"\x00\x01\x00\x01\x00\n\xec\x1c"
 
 
+class CustomResponse(ModbusResponse):
+    """Custom response, function code unknown to the standard decoders."""
+
+    function_code = 0x55
+    _rtu_frame_size = 4
+
+
+class CustomRequest(ModbusRequest):
+    """Custom request, function code unknown to the standard decoders."""
+
+    function_code = 0x55
+    _rtu_frame_size = 4
+
+
+def header_fields(framer):
+    """Return the framer header as a dict."""
+    header = framer._header  # pylint: disable=protected-access
+    return {name: getattr(header, name) for name in header.__slots__}
+
+
 @pytest.fixture(name="rtu_framer")
 def fixture_rtu_framer():
     """RTU framer."""
@@ -51,35 +72,35 @@ def test_framer_initialization(framer):
     assert framer._buffer == b""  # pylint: disable=protected-access
     assert framer.decoder == decoder
     if isinstance(framer, ModbusAsciiFramer):
-        assert framer._header == {  # pylint: disable=protected-access
+        assert header_fields(framer) == {
             "tid": 0,
             "pid": 0,
             "lrc": "0000",
             "len": 0,
             "uid": 0x00,
-            "crc": b"\x00\x00",
+            "crc": 0x0000,
         }
         assert framer._hsize == 0x02  # pylint: disable=protected-access
         assert framer._start == b":"  # pylint: disable=protected-access
         assert framer._end == b"\r\n"  # pylint: disable=protected-access
     elif isinstance(framer, ModbusRtuFramer):
-        assert framer._header == {  # pylint: disable=protected-access
+        assert header_fields(framer) == {
             "tid": 0,
             "pid": 0,
             "lrc": "0000",
             "uid": 0x00,
             "len": 0,
-            "crc": b"\x00\x00",
+            "crc": 0x0000,
         }
         assert framer._hsize == 0x01  # pylint: disable=protected-access
         assert framer._end == b"\x0d\x0a"  # pylint: disable=protected-access
         assert framer._min_frame_size == 4  # pylint: disable=protected-access
     else:
-        assert framer._header == {  # pylint: disable=protected-access
+        assert header_fields(framer) == {
             "tid": 0,
             "pid": 0,
             "lrc": "0000",
-            "crc": b"\x00\x00",
+            "crc": 0x0000,
             "len": 0,
             "uid": 0x00,
         }
@@ -104,33 +125,36 @@ def test_framer_initialization(framer):
 def test_check_frame(rtu_framer, data):
     """Test check frame."""
     data, expected = data
-    rtu_framer._buffer = data  # pylint: disable=protected-access
+    rtu_framer._buffer = bytearray(data)  # pylint: disable=protected-access
     assert expected == rtu_framer.checkFrame()
 
 
 @pytest.mark.parametrize(
     "data",
     [
-        (b"", {"uid": 0x00, "len": 0, "crc": b"\x00\x00"}, b""),
-        (b"abcd", {"uid": 0x00, "len": 2, "crc": b"\x00\x00"}, b"cd"),
+        (b"", 0, b""),
+        (b"abcd", 2, b"cd"),
         (
             b"\x11\x03\x06\xAE\x41\x56\x52\x43\x40\x49\xAD\x12\x03",  # real case, frame size is 11
-            {"uid": 0x00, "len": 11, "crc": b"\x00\x00"},
+            11,
             b"\x12\x03",
         ),
     ],
 )
 def test_rtu_advance_framer(rtu_framer, data):
     """Test rtu advance framer."""
-    before_buf, before_header, after_buf = data
+    before_buf, before_len, after_buf = data
 
-    rtu_framer._buffer = before_buf  # pylint: disable=protected-access
-    rtu_framer._header = before_header  # pylint: disable=protected-access
+    rtu_framer._buffer = bytearray(before_buf)  # pylint: disable=protected-access
+    rtu_framer._header.len = before_len  # pylint: disable=protected-access
     rtu_framer.advanceFrame()
-    assert rtu_framer._header == {  # pylint: disable=protected-access
-        "uid": 0x00,
+    assert header_fields(rtu_framer) == {
+        "lrc": "0000",
+        "crc": 0x0000,
         "len": 0,
-        "crc": b"\x00\x00",
+        "uid": 0x00,
+        "pid": 0,
+        "tid": 0,
     }
     assert rtu_framer._buffer == after_buf  # pylint: disable=protected-access
 
@@ -138,11 +162,11 @@ def test_rtu_advance_framer(rtu_framer, data):
 @pytest.mark.parametrize("data", [b"", b"abcd"])
 def test_rtu_reset_framer(rtu_framer, data):
     """Test rtu reset framer."""
-    rtu_framer._buffer = data  # pylint: disable=protected-access
+    rtu_framer._buffer = bytearray(data)  # pylint: disable=protected-access
     rtu_framer.resetFrame()
-    assert rtu_framer._header == {  # pylint: disable=protected-access
+    assert header_fields(rtu_framer) == {
         "lrc": "0000",
-        "crc": b"\x00\x00",
+        "crc": 0x0000,
         "len": 0,
         "uid": 0x00,
         "pid": 0,
@@ -165,7 +189,7 @@ def test_rtu_reset_framer(rtu_framer, data):
 def test_is_frame_ready(rtu_framer, data):
     """Test is frame ready."""
     data, expected = data
-    rtu_framer._buffer = data  # pylint: disable=protected-access
+    rtu_framer._buffer = bytearray(data)  # pylint: disable=protected-access
     # rtu_framer.advanceFrame()
     assert rtu_framer.isFrameReady() == expected
 
@@ -192,7 +216,7 @@ def test_rtu_populate_header_fail(rtu_framer, data):
         (
             b"\x11\x03\x06\xAE\x41\x56\x52\x43\x40\x49\xAD",
             {
-                "crc": b"\x49\xAD",
+                "crc": 0x49AD,
                 "uid": 17,
                 "len": 11,
                 "lrc": "0000",
@@ -203,7 +227,7 @@ def test_rtu_populate_header_fail(rtu_framer, data):
         (
             b"\x11\x03\x06\xAE\x41\x56\x52\x43\x40\x49\xAD\x11\x03",
             {
-                "crc": b"\x49\xAD",
+                "crc": 0x49AD,
                 "uid": 17,
                 "len": 11,
                 "lrc": "0000",
@@ -217,19 +241,60 @@ def test_rtu_populate_header(rtu_framer, data):
     """Test rtu populate header."""
     buffer, expected = data
     rtu_framer.populateHeader(buffer)
-    assert rtu_framer._header == expected  # pylint: disable=protected-access
+    assert header_fields(rtu_framer) == expected
+
+
+def test_rtu_decoder_register(rtu_framer):
+    """Test a function code registered on the decoder is found by the framer."""
+    message = b"\x01\x55\xc0\x1f"
+    rtu_framer._buffer = bytearray(message)  # pylint: disable=protected-access
+    assert not rtu_framer.getFrameStart([1], False, False)
+    rtu_framer.decoder.register(CustomResponse)
+    rtu_framer._buffer = bytearray(message)  # pylint: disable=protected-access
+    assert rtu_framer.getFrameStart([1], False, False)
+    assert rtu_framer.getFrameStart([0], True, False)
+
+
+def test_rtu_expected_response_length(rtu_framer):
+    """Test expected response length follows a decoder change."""
+    data = b"\x11\x03\x06\xAE\x41\x56\x52\x43\x40\x49\xAD"
+    assert rtu_framer.get_expected_response_length(data) == 11
+    assert rtu_framer.get_expected_response_length(data) == 11
+    assert rtu_framer.get_expected_response_length(b"\x11\x83\x02\xC0\xF1") == 5
+    rtu_framer.decoder = ServerDecoder()
+    assert rtu_framer.get_expected_response_length(data) == 8
+    message = b"\x01\x55\xc0\x1f"
+    assert rtu_framer.get_expected_response_length(message) == 5
+    rtu_framer.decoder.register(CustomRequest)
+    assert rtu_framer.get_expected_response_length(message) == 4
+
+
+def test_rtu_expected_response_length_decoder_override(rtu_framer):
+    """Test expected response length uses lookupPduClass of the decoder."""
+
+    class CustomDecoder(ClientDecoder):
+        """Decoder resolving function code 0x55 without registering it."""
+
+        def lookupPduClass(self, function_code):
+            """Use `function_code` to determine the class of the PDU."""
+            if function_code == CustomResponse.function_code:
+                return CustomResponse
+            return super().lookupPduClass(function_code)
+
+    rtu_framer.decoder = CustomDecoder()
+    assert rtu_framer.get_expected_response_length(b"\x01\x55\xc0\x1f") == 4
 
 
 def test_get_frame(rtu_framer):
     """Test get frame."""
-    rtu_framer._buffer = b"\x02\x01\x01\x00Q\xcc"  # pylint: disable=protected-access
+    rtu_framer._buffer = bytearray(b"\x02\x01\x01\x00Q\xcc")  # pylint: disable=protected-access
     rtu_framer.populateHeader(b"\x02\x01\x01\x00Q\xcc")
     assert rtu_framer.getFrame() == b"\x01\x01\x00"
 
 
 def test_populate_result(rtu_framer):
     """Test populate result."""
-    rtu_framer._header["uid"] = 255  # pylint: disable=protected-access
+    rtu_framer._header.uid = 255  # pylint: disable=protected-access
     result = mock.Mock()
     rtu_framer.populateResult(result)
     assert result.slave_id == 255
@@ -308,6 +373,23 @@ def test_send_packet(rtu_framer):
     assert rtu_framer.sendPacket(message) == len(message)
 
 
+def test_send_packet_wait_remaining_gap(rtu_framer):
+    """Test send packet sleeps only for the rest of the 3.5 char gap."""
+    message = TEST_MESSAGE
+    client = mock.Mock()
+    client.state = ModbusTransactionState.TRANSACTION_COMPLETE
+    client.comm_params.timeout_connect = 0.25
+    client.last_frame_end = 10.0
+    client.idle_time.return_value = 10.5
+    client.send.return_value = len(message)
+    rtu_framer.client = client
+    with mock.patch("pymodbus.framer.rtu_framer.time") as mock_time:
+        mock_time.monotonic.return_value = 10.2
+        assert rtu_framer.sendPacket(message) == len(message)
+    mock_time.sleep.assert_called_once_with(pytest.approx(0.3))
+    assert client.state == ModbusTransactionState.IDLE
+
+
 def test_recv_packet(rtu_framer):
     """Test receive packet."""
     message = TEST_MESSAGE
@@ -318,7 +400,7 @@ def test_recv_packet(rtu_framer):
 
 def test_process(rtu_framer):
     """Test process."""
-    rtu_framer._buffer = TEST_MESSAGE  # pylint: disable=protected-access
+    rtu_framer._buffer = bytearray(TEST_MESSAGE)  # pylint: disable=protected-access
     with pytest.raises(ModbusIOException):
         rtu_framer._process(None)  # pylint: disable=protected-access
 
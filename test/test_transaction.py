@@ -296,7 +296,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         msg = b"\x00\x01\x12\x34\x00\x04\xff\x02\x12\x34"
         assert not self._tcp.isFrameReady()
         assert not self._tcp.checkFrame()
-        self._tcp._buffer = msg  # pylint: disable=protected-access
+        self._tcp._buffer = bytearray(msg)  # pylint: disable=protected-access
         assert self._tcp.isFrameReady()
         assert self._tcp.checkFrame()
         self._tcp.advanceFrame()
@@ -307,7 +307,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
     def test_tcp_framer_transaction_full(self):
         """Test a full tcp frame transaction."""
         msg = b"\x00\x01\x12\x34\x00\x04\xff\x02\x12\x34"
-        self._tcp._buffer = msg  # pylint: disable=protected-access
+        self._tcp._buffer = bytearray(msg)  # pylint: disable=protected-access
         assert self._tcp.checkFrame()
         result = self._tcp.getFrame()
         assert result == msg[7:]
@@ -317,7 +317,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         """Test a half completed tcp frame transaction."""
         msg1 = b"\x00\x01\x12\x34\x00"
         msg2 = b"\x04\xff\x02\x12\x34"
-        self._tcp._buffer = msg1  # pylint: disable=protected-access
+        self._tcp._buffer = bytearray(msg1)  # pylint: disable=protected-access
         assert not self._tcp.checkFrame()
         result = self._tcp.getFrame()
         assert result == b""
@@ -331,7 +331,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         """Test a half completed tcp frame transaction."""
         msg1 = b"\x00\x01\x12\x34\x00\x04\xff"
         msg2 = b"\x02\x12\x34"
-        self._tcp._buffer = msg1  # pylint: disable=protected-access
+        self._tcp._buffer = bytearray(msg1)  # pylint: disable=protected-access
         assert not self._tcp.checkFrame()
         result = self._tcp.getFrame()
         assert result == b""
@@ -345,7 +345,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         """Test a half completed tcp frame transaction."""
         msg1 = b"\x00\x01\x12\x34\x00\x04\xff\x02\x12"
         msg2 = b"\x34"
-        self._tcp._buffer = msg1  # pylint: disable=protected-access
+        self._tcp._buffer = bytearray(msg1)  # pylint: disable=protected-access
         assert not self._tcp.checkFrame()
         result = self._tcp.getFrame()
         assert result == msg1[7:]
@@ -359,7 +359,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         """Test that we can get back on track after an invalid message."""
         msg1 = b"\x99\x99\x99\x99\x00\x01\x00\x01"
         msg2 = b"\x00\x01\x12\x34\x00\x04\xff\x02\x12\x34"
-        self._tcp._buffer = msg1  # pylint: disable=protected-access
+        self._tcp._buffer = bytearray(msg1)  # pylint: disable=protected-access
         assert not self._tcp.checkFrame()
         result = self._tcp.getFrame()
         assert result == b""
@@ -378,7 +378,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         expected.protocol_id = 0x1234
         expected.slave_id = 0xFF
         msg = b"\x00\x01\x12\x34\x00\x04\xff\x02\x12\x34"
-        self._tcp._buffer = msg  # pylint: disable=protected-access
+        self._tcp._buffer = bytearray(msg)  # pylint: disable=protected-access
         assert self._tcp.checkFrame()
         actual = ModbusRequest()
         self._tcp.populateResult(actual)
@@ -547,7 +547,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         assert not self._rtu.isFrameReady()
 
         msg_parts = [b"\x00\x01\x00", b"\x00\x00\x01\xfc\x1b"]
-        self._rtu._buffer = msg_parts[0]  # pylint: disable=protected-access
+        self._rtu._buffer = bytearray(msg_parts[0])  # pylint: disable=protected-access
         assert not self._rtu.isFrameReady()
         assert not self._rtu.checkFrame()
 
@@ -559,7 +559,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         """Test a full rtu frame transaction."""
         msg = b"\x00\x01\x00\x00\x00\x01\xfc\x1b"
         stripped_msg = msg[1:-2]
-        self._rtu._buffer = msg  # pylint: disable=protected-access
+        self._rtu._buffer = bytearray(msg)  # pylint: disable=protected-access
         assert self._rtu.checkFrame()
         result = self._rtu.getFrame()
         assert stripped_msg == result
@@ -569,7 +569,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         """Test a half completed rtu frame transaction."""
         msg_parts = [b"\x00\x01\x00", b"\x00\x00\x01\xfc\x1b"]
         stripped_msg = b"".join(msg_parts)[1:-2]
-        self._rtu._buffer = msg_parts[0]  # pylint: disable=protected-access
+        self._rtu._buffer = bytearray(msg_parts[0])  # pylint: disable=protected-access
         assert not self._rtu.checkFrame()
         self._rtu._buffer += msg_parts[1]
         assert self._rtu.isFrameReady()
@@ -582,14 +582,14 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         """Test a rtu frame packet build."""
         request = ModbusRequest()
         msg = b"\x00\x01\x00\x00\x00\x01\xfc\x1b"
-        self._rtu._buffer = msg  # pylint: disable=protected-access
+        self._rtu._buffer = bytearray(msg)  # pylint: disable=protected-access
         self._rtu.populateHeader()
         self._rtu.populateResult(request)
 
-        header_dict = self._rtu._header  # pylint: disable=protected-access
-        assert len(msg) == header_dict["len"]
-        assert int(msg[0]) == header_dict["uid"]
-        assert msg[-2:] == header_dict["crc"]
+        header = self._rtu._header  # pylint: disable=protected-access
+        assert len(msg) == header.len
+        assert int(msg[0]) == header.uid
+        assert int.from_bytes(msg[-2:], "big") == header.crc
         assert not request.slave_id
 
     def test_rtu_framer_packet(self):
@@ -607,7 +607,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
     def test_rtu_decode_exception(self):
         """Test that the RTU framer can decode errors."""
         message = b"\x00\x90\x02\x9c\x01"
-        self._rtu._buffer = message  # pylint: disable=protected-access
+        self._rtu._buffer = bytearray(message)  # pylint: disable=protected-access
         result = self._rtu.checkFrame()
         assert result
 
@@ -650,7 +650,9 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
 
         self._rtu._buffer = mock.MagicMock()  # pylint: disable=protected-access
         self._rtu._process = mock.MagicMock()  # pylint: disable=protected-access
-        self._rtu.isFrameReady = mock.MagicMock(return_value=False)
+        self._rtu._try_parse_frame = mock.MagicMock(  # pylint: disable=protected-access
+            return_value=(False, False)
+        )
         self._rtu._buffer = mock_data  # pylint: disable=protected-access
 
         self._rtu.processIncomingPacket(mock_data, mock_callback, slave)
@@ -663,7 +665,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         msg = b":F7031389000A60\r\n"
         assert not self._ascii.isFrameReady()
         assert not self._ascii.checkFrame()
-        self._ascii._buffer = msg  # pylint: disable=protected-access
+        self._ascii._buffer = bytearray(msg)  # pylint: disable=protected-access
         assert self._ascii.isFrameReady()
         assert self._ascii.checkFrame()
         self._ascii.advanceFrame()
@@ -675,7 +677,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         """Test a full ascii frame transaction."""
         msg = b"sss:F7031389000A60\r\n"
         pack = a2b_hex(msg[6:-4])
-        self._ascii._buffer = msg  # pylint: disable=protected-access
+        self._ascii._buffer = bytearray(msg)  # pylint: disable=protected-access
         assert self._ascii.checkFrame()
         result = self._ascii.getFrame()
         assert pack == result
@@ -686,7 +688,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         msg1 = b"sss:F7031389"
         msg2 = b"000A60\r\n"
         pack = a2b_hex(msg1[6:] + msg2[:-4])
-        self._ascii._buffer = msg1  # pylint: disable=protected-access
+        self._ascii._buffer = bytearray(msg1)  # pylint: disable=protected-access
         assert not self._ascii.checkFrame()
         result = self._ascii.getFrame()
         assert not result
@@ -736,7 +738,7 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         msg = TEST_MESSAGE
         assert not self._binary.isFrameReady()
         assert not self._binary.checkFrame()
-        self._binary._buffer = msg  # pylint: disable=protected-access
+        self._binary._buffer = bytearray(msg)  # pylint: disable=protected-access
         assert self._binary.isFrameReady()
         assert self._binary.checkFrame()
         self._binary.advanceFrame()
@@ -748,18 +750,30 @@ class TestTransaction:  # pylint: disable=too-many-public-methods
         """Test a full binary frame transaction."""
         msg = TEST_MESSAGE
         pack = msg[2:-3]
-        self._binary._buffer = msg  # pylint: disable=protected-access
+        self._binary._buffer = bytearray(msg)  # pylint: disable=protected-access
         assert self._binary.checkFrame()
         result = self._binary.getFrame()
         assert pack == result
         self._binary.advanceFrame()
 
+    def test_binary_framer_transaction_garbage(self):
+        """Test a binary frame transaction with leading garbage."""
+        msg = TEST_MESSAGE
+        pack = msg[2:-3]
+        garbage = b"\x01\x02"
+        self._binary._buffer = bytearray(garbage + msg)  # pylint: disable=protected-access
+        assert self._binary.checkFrame()
+        result = self._binary.getFrame()
+        assert pack == result
+        self._binary.advanceFrame()
+        assert not self._binary.isFrameReady()
+
     def test_binary_framer_transaction_half(self):
         """Test a half completed binary frame transaction."""
         msg1 = b"\x7b\x01\x03\x00"
         msg2 = b"\x00\x00\x05\x85\xC9\x7d"
         pack = msg1[2:] + msg2[:-3]
-        self._binary._buffer = msg1  # pylint: disable=protected-access
+        self._binary._buffer = bytearray(msg1)  # pylint: disable=protected-access
         assert not self._binary.checkFrame()
         result = self._binary.getFrame()
         assert not result
@@ -102,3 +102,9 @@ class TestUtility:
         """Test the cyclic redundancy check code."""
         assert checkCRC(self.data, 0xE2DB)
         assert checkCRC(self.string, 0x889E)
+
+    def test_cyclic_redundancy_check_buffers(self):
+        """Test the cyclic redundancy check code on buffer types."""
+        assert checkCRC(bytearray(self.data), 0xE2DB)
+        assert checkCRC(memoryview(self.data), 0xE2DB)
+        assert checkCRC(memoryview(self.data + b"\x00")[:-1], 0xE2DB)